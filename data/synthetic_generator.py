@@ -1,6 +1,11 @@
+import argparse
 import csv
+import math
+import os
 import random
 
+import numpy as np
+
 def generate_synthetic_trace(filename, num_tasks=100, seed=42):
     random.seed(seed)
     with open(filename, 'w', newline='') as csvfile:
@@ -14,5 +19,321 @@ def generate_synthetic_trace(filename, num_tasks=100, seed=42):
             length = random.randint(60, 600)  # 1 to 10 minutes
             writer.writerow([i, round(arrival, 2), cpu, mem, length])
 
+
+# -------------------------
+# Vectorized generator for large workloads
+# -------------------------
+# Distributions are given as tuples:
+#   ("choice", values) or ("choice", values, probs)
+#   ("randint", low, high)          # inclusive, like random.randint
+#   ("uniform", low, high)
+#   ("exponential", mean)
+#   ("lognormal", mean, sigma)      # parameters of the underlying normal
+DEFAULT_CPU = ("choice", [500, 750, 1000, 1200, 1500])
+DEFAULT_MEM = ("choice", [512, 1024, 2048, 4096])
+DEFAULT_LENGTH = ("randint", 60, 600)
+
+DEFAULT_VM_CPU = ("choice", [1000, 2000, 4000])
+DEFAULT_VM_MEM = ("choice", [2048, 4096, 8192])
+DEFAULT_HOST_CPU = ("choice", [10000, 20000])
+DEFAULT_HOST_MEM = ("choice", [32768, 65536])
+
+ARRIVAL_PATTERNS = ("poisson", "bursty", "diurnal")
+
+TASK_COLUMNS = ['id', 'arrival', 'cpu', 'mem', 'length']
+VM_COLUMNS = ['id', 'cpu_capacity', 'mem_capacity']
+HOST_COLUMNS = ['id', 'cpu_capacity', 'mem_capacity', 'idle_power', 'max_power']
+
+# csv: number of decimals per column; ids are integers, arrival is rounded like
+# generate_synthetic_trace, other values keep up to 6 decimals (none for whole numbers)
+_CSV_DECIMALS = {'id': 0, 'arrival': 2}
+_CSV_DEFAULT_DECIMALS = 6
+_CSV_FIXED_DECIMALS = ('arrival',)
+# rows formatted at a time; the (rows, width) digit arrays stay cache-sized
+_CSV_FORMAT_ROWS = 100_000
+# npy: compact structured records (float32 is exact for the integer-valued defaults)
+_NPY_DTYPE = {'id': np.int64, 'arrival': np.float64}
+_NPY_DEFAULT_DTYPE = np.float32
+
+
+def sample(rng, spec, size):
+    """Draw `size` values from the distribution described by `spec`."""
+    kind = spec[0]
+    if kind == "choice":
+        values = np.asarray(spec[1], dtype=np.float64)
+        probs = spec[2] if len(spec) > 2 else None
+        return rng.choice(values, size=size, p=probs)
+    if kind == "randint":
+        return rng.integers(spec[1], spec[2] + 1, size=size).astype(np.float64)
+    if kind == "uniform":
+        return rng.uniform(spec[1], spec[2], size=size)
+    if kind == "exponential":
+        return rng.exponential(spec[1], size=size)
+    if kind == "lognormal":
+        return rng.lognormal(spec[1], spec[2], size=size)
+    raise ValueError(f"Unknown distribution: {kind}")
+
+
+class ArrivalProcess:
+    """
+    Produces absolute arrival times chunk by chunk, carrying state between chunks.
+
+    poisson: exponential inter-arrival times with mean `mean_interarrival`.
+    bursty:  each task starts a new burst with probability 1/burst_size; gaps inside a
+             burst are burst_intra_frac * mean_interarrival, the gap before a burst is
+             chosen so the long-run mean inter-arrival time stays `mean_interarrival`.
+    diurnal: non-homogeneous Poisson process with rate
+             (1 + diurnal_amplitude * sin(2*pi*t / diurnal_period)) / mean_interarrival.
+    """
+
+    def __init__(self, rng, burst_rng, pattern="poisson", mean_interarrival=10.0,
+                 burst_size=20.0, burst_intra_frac=0.05,
+                 diurnal_period=86400.0, diurnal_amplitude=0.8):
+        if pattern not in ARRIVAL_PATTERNS:
+            raise ValueError(f"Unknown arrival pattern: {pattern} (expected one of {ARRIVAL_PATTERNS})")
+        if not mean_interarrival > 0:
+            raise ValueError("mean_interarrival must be > 0")
+        if pattern == "bursty" and not (burst_size >= 1 and 0 <= burst_intra_frac <= 1):
+            raise ValueError("bursty arrivals need burst_size >= 1 and 0 <= burst_intra_frac <= 1")
+        if pattern == "diurnal" and not 0 <= diurnal_amplitude < 1:
+            raise ValueError("diurnal_amplitude must be in [0, 1)")
+        if pattern == "diurnal" and not diurnal_period > 0:
+            raise ValueError("diurnal_period must be > 0")
+        self.rng = rng
+        self.burst_rng = burst_rng
+        self.pattern = pattern
+        self.mean = mean_interarrival
+        if pattern == "bursty":
+            self.burst_prob = 1.0 / burst_size
+            self.intra_gap = burst_intra_frac * mean_interarrival
+            self.burst_gap = (mean_interarrival - (1 - self.burst_prob) * self.intra_gap) / self.burst_prob
+        self.period = diurnal_period
+        self.amplitude = diurnal_amplitude
+        self.last = 0.0  # last arrival time (poisson/bursty) or cumulative intensity (diurnal)
+
+    def next_chunk(self, size):
+        if self.pattern == "poisson":
+            gaps = self.rng.exponential(self.mean, size=size)
+        elif self.pattern == "bursty":
+            new_burst = self.burst_rng.random(size) < self.burst_prob
+            gaps = self.rng.exponential(1.0, size=size) * np.where(new_burst, self.burst_gap, self.intra_gap)
+        else:
+            # unit-rate arrivals in "intensity time", mapped back through the inverse of Lambda(t)
+            gaps = self.rng.exponential(1.0, size=size)
+        times = self.last + np.cumsum(gaps)
+        self.last = float(times[-1]) if size else self.last
+        if self.pattern == "diurnal":
+            times = self._invert_intensity(times)
+        return times
+
+    def _invert_intensity(self, lam):
+        # Lambda(t) = (t + A / w * (1 - cos(w t))) / mean is increasing and satisfies
+        # t <= mean * Lambda(t) <= t + 2A/w, so bisect on [mean*Lambda - 2A/w, mean*Lambda].
+        w = 2 * math.pi / self.period
+        target = lam * self.mean
+        lo = np.maximum(target - 2 * self.amplitude / w, 0.0)
+        hi = target.copy()
+        for _ in range(60):
+            mid = 0.5 * (lo + hi)
+            below = mid + self.amplitude / w * (1 - np.cos(w * mid)) < target
+            lo = np.where(below, mid, lo)
+            hi = np.where(below, hi, mid)
+        return 0.5 * (lo + hi)
+
+
+def _file_format(filename, file_format):
+    if file_format is None:
+        file_format = "npy" if filename.endswith(".npy") else "csv"
+    if file_format not in ("csv", "npy"):
+        raise ValueError(f"Unknown file format: {file_format} (expected 'csv' or 'npy')")
+    return file_format
+
+
+def _format_column(values, decimals, strip_zeros):
+    """
+    Format a column of numbers as ASCII without a per-row Python loop.
+
+    Returns a (n, width) uint8 array of characters, right-aligned, where 0 marks
+    padding that is dropped when the rows are written. With strip_zeros, trailing
+    zeros of the decimals (and a bare ".") are dropped too. Values are rounded as
+    rint(value * 10**decimals), which can differ from "%f" in the last digit on ties.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scale = 10 ** decimals
+    scaled = np.rint(np.abs(values) * scale)
+    if scaled.size and scaled.max() >= 2 ** 63:
+        raise ValueError(f"Value too large to write as CSV with {decimals} decimals")
+    scaled = scaled.astype(np.int64)
+    whole, frac = np.divmod(scaled, scale)
+
+    width = len(str(int(whole.max()))) if whole.size else 1
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    int_digits = ((whole[:, None] // powers) % 10).astype(np.uint8)
+    # leading zeros are padding, but the units digit is always written
+    num_digits = np.maximum(np.searchsorted(powers[::-1], whole, side='right'), 1)
+    leading = np.arange(width) < (width - num_digits)[:, None]
+    parts = [
+        np.where((values < 0) & (scaled > 0), ord('-'), 0).astype(np.uint8)[:, None],
+        np.where(leading, 0, int_digits + ord('0')).astype(np.uint8),
+    ]
+    if decimals and (not strip_zeros or frac.any()):
+        frac_powers = 10 ** np.arange(decimals - 1, -1, -1, dtype=np.int64)
+        frac_digits = ((frac[:, None] // frac_powers) % 10).astype(np.uint8)
+        if strip_zeros:
+            trailing_zeros = sum((frac % 10 ** k == 0).astype(np.int64) for k in range(1, decimals + 1))
+            trailing = np.arange(decimals) >= (decimals - trailing_zeros)[:, None]
+        else:
+            trailing = np.zeros(frac_digits.shape, dtype=bool)
+        point = np.where(trailing[:, 0], 0, ord('.')).astype(np.uint8)[:, None]
+        parts += [point, np.where(trailing, 0, frac_digits + ord('0')).astype(np.uint8)]
+    return np.concatenate(parts, axis=1)
+
+
+def _format_csv_rows(chunk, columns):
+    """Format a chunk of columns as CSV text (bytes), one vectorized pass per column."""
+    n = len(chunk[columns[0]])
+    cells = []
+    for i, c in enumerate(columns):
+        if i:
+            cells.append(np.full((n, 1), ord(','), dtype=np.uint8))
+        cells.append(_format_column(chunk[c], _CSV_DECIMALS.get(c, _CSV_DEFAULT_DECIMALS),
+                                    strip_zeros=c not in _CSV_FIXED_DECIMALS))
+    cells.append(np.full((n, 1), ord('\n'), dtype=np.uint8))
+    text = np.concatenate(cells, axis=1).ravel()
+    return text[text != 0].tobytes()
+
+
+def _write_chunks(filename, columns, num_rows, chunks, file_format=None):
+    """
+    Write the column chunks produced by `chunks` (an iterator of dicts of equal-length
+    arrays) to CSV or to a .npy file of structured records, one chunk at a time.
+    CSV text is built column-wise as a byte array rather than row by row, in blocks
+    of _CSV_FORMAT_ROWS rows so the digit temporaries stay small whatever the chunk
+    size. It is still bound by text formatting, so .npy is much faster and smaller.
+    """
+    file_format = _file_format(filename, file_format)
+    if file_format == "csv":
+        with open(filename, 'wb') as f:
+            f.write((",".join(columns) + "\n").encode("ascii"))
+            for chunk in chunks:
+                n = len(chunk[columns[0]])
+                for start in range(0, n, _CSV_FORMAT_ROWS):
+                    part = {c: chunk[c][start:start + _CSV_FORMAT_ROWS] for c in columns}
+                    f.write(_format_csv_rows(part, columns))
+    else:
+        dtype = np.dtype([(c, _NPY_DTYPE.get(c, _NPY_DEFAULT_DTYPE)) for c in columns])
+        out = np.lib.format.open_memmap(filename, mode='w+', dtype=dtype, shape=(num_rows,))
+        start = 0
+        for chunk in chunks:
+            n = len(chunk[columns[0]])
+            for c in columns:
+                out[c][start:start + n] = chunk[c]
+            out.flush()
+            start += n
+        del out
+
+
+def _chunk_sizes(num_rows, chunk_size):
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    for start in range(0, num_rows, chunk_size):
+        yield start, min(chunk_size, num_rows - start)
+
+
+def generate_workload(filename, num_tasks=100, seed=42, arrival="poisson", mean_interarrival=10.0,
+                      cpu=DEFAULT_CPU, mem=DEFAULT_MEM, length=DEFAULT_LENGTH,
+                      chunk_size=250_000, file_format=None, **arrival_params):
+    """
+    Vectorized, chunked version of generate_synthetic_trace for multi-million-task workloads.
+
+    Writes the same columns (id, arrival, cpu, mem, length) either as CSV or, for
+    filenames ending in .npy (or file_format="npy"), as a numpy file of structured
+    records; read it back with src.utils.io_utils.load_tasks (passing the same
+    file_format if the name does not end in .npy).
+    At most `chunk_size` rows are held in memory at a time. For 2M tasks with the
+    default settings: generate_synthetic_trace ~6-8 s, CSV ~1.6-2.4 s (~75 MB peak
+    RSS), .npy ~0.2-0.5 s, so .npy is the fast path for multi-million-task workloads.
+
+    Every column draws from its own random stream derived from `seed`, so the output
+    depends only on the seed and the distributions, not on `chunk_size`.
+
+    Extra keyword arguments (burst_size, burst_intra_frac, diurnal_period,
+    diurnal_amplitude) configure the arrival pattern, see ArrivalProcess.
+    """
+    arrival_rng, burst_rng, cpu_rng, mem_rng, length_rng = [
+        np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(5)
+    ]
+    arrivals = ArrivalProcess(arrival_rng, burst_rng, arrival, mean_interarrival, **arrival_params)
+
+    def chunks():
+        for start, n in _chunk_sizes(num_tasks, chunk_size):
+            yield {
+                'id': np.arange(start + 1, start + n + 1),
+                'arrival': arrivals.next_chunk(n),
+                'cpu': sample(cpu_rng, cpu, n),
+                'mem': sample(mem_rng, mem, n),
+                'length': sample(length_rng, length, n),
+            }
+
+    _write_chunks(filename, TASK_COLUMNS, num_tasks, chunks(), file_format)
+
+
+def generate_fleet(vm_filename, host_filename, num_vms=10, num_hosts=3, seed=42,
+                   vm_cpu=DEFAULT_VM_CPU, vm_mem=DEFAULT_VM_MEM,
+                   host_cpu=DEFAULT_HOST_CPU, host_mem=DEFAULT_HOST_MEM,
+                   idle_power=100.0, max_power=250.0, chunk_size=250_000, file_format=None):
+    """
+    Generate a matching VM and host fleet (capacities drawn from the given distributions)
+    and write it in the same formats as generate_workload. VM and host ids start at 0,
+    matching how the runner builds its fleet.
+    """
+    # [seed, 1] keeps the fleet streams independent of generate_workload's for the same seed;
+    # seed=None draws fresh OS entropy, as in generate_workload
+    fleet_seed = None if seed is None else [seed, 1]
+    vm_cpu_rng, vm_mem_rng, host_cpu_rng, host_mem_rng = [
+        np.random.default_rng(s) for s in np.random.SeedSequence(fleet_seed).spawn(4)
+    ]
+
+    def vm_chunks():
+        for start, n in _chunk_sizes(num_vms, chunk_size):
+            yield {
+                'id': np.arange(start, start + n),
+                'cpu_capacity': sample(vm_cpu_rng, vm_cpu, n),
+                'mem_capacity': sample(vm_mem_rng, vm_mem, n),
+            }
+
+    def host_chunks():
+        for start, n in _chunk_sizes(num_hosts, chunk_size):
+            yield {
+                'id': np.arange(start, start + n),
+                'cpu_capacity': sample(host_cpu_rng, host_cpu, n),
+                'mem_capacity': sample(host_mem_rng, host_mem, n),
+                'idle_power': np.full(n, idle_power),
+                'max_power': np.full(n, max_power),
+            }
+
+    _write_chunks(vm_filename, VM_COLUMNS, num_vms, vm_chunks(), file_format)
+    _write_chunks(host_filename, HOST_COLUMNS, num_hosts, host_chunks(), file_format)
+
+
 if __name__ == "__main__":
-    generate_synthetic_trace('sample_google_trace.csv', num_tasks=100)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate a synthetic workload (and optionally a fleet).")
+    parser.add_argument("--out", help="output file (.csv or .npy); omit to regenerate sample_google_trace.csv")
+    parser.add_argument("--tasks", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--arrival", choices=ARRIVAL_PATTERNS, default="poisson")
+    parser.add_argument("--mean-interarrival", type=float, default=10.0)
+    parser.add_argument("--chunk-size", type=int, default=250_000)
+    parser.add_argument("--vms", type=int, default=0, help="also write <out>_vms / <out>_hosts with this many VMs")
+    parser.add_argument("--hosts", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.out is None:
+        generate_synthetic_trace('sample_google_trace.csv', num_tasks=100)
+    else:
+        generate_workload(args.out, num_tasks=args.tasks, seed=args.seed, arrival=args.arrival,
+                          mean_interarrival=args.mean_interarrival, chunk_size=args.chunk_size)
+        if args.vms:
+            root, ext = os.path.splitext(args.out)
+            generate_fleet(f"{root}_vms{ext}", f"{root}_hosts{ext}", num_vms=args.vms,
+                           num_hosts=args.hosts, seed=args.seed, chunk_size=args.chunk_size)
@@ -0,0 +1,358 @@
+# src/ga/batch.py
+#
+# Batched GA: evolve many small, independent (tasks, VMs, hosts) instances at once.
+# All instances are stacked into padded numpy arrays so that selection, variation,
+# repair and evaluation run once per generation for the whole batch instead of
+# once per chromosome per instance.
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+
+from src.ga.fitness import DEFAULT_WEIGHTS, SLA_LENGTH_LIMIT
+
+METRIC_KEYS = ["makespan", "energy", "avg_utilization", "sla_violations", "unassigned_tasks"]
+
+
+@dataclass
+class PackedInstances:
+    """
+    Padded array view of a batch of scheduling instances.
+    Leading axis is the instance index b; padded slots are masked out.
+    """
+    n_tasks: np.ndarray        # (B,)   real number of tasks per instance
+    n_vms: np.ndarray          # (B,)
+    n_hosts: np.ndarray        # (B,)
+    task_cpu: np.ndarray       # (B, T) zero in padded slots
+    task_mem: np.ndarray       # (B, T)
+    task_len: np.ndarray       # (B, T)
+    task_mask: np.ndarray      # (B, T) bool
+    vm_cpu_cap: np.ndarray     # (B, V)
+    vm_mem_cap: np.ndarray     # (B, V)
+    vm_mask: np.ndarray        # (B, V) bool
+    vm_base_len: np.ndarray    # (B, V) tasks already present on the VM templates
+    vm_base_cpu: np.ndarray    # (B, V)
+    vm_base_sla: np.ndarray    # (B,)
+    vm_host: np.ndarray        # (B, V, H) one-hot round-robin VM -> host placement
+    host_cpu_cap: np.ndarray   # (B, H) 1.0 in padded slots (avoids division by zero)
+    host_base_cpu: np.ndarray  # (B, H) load of VMs already present on the host templates
+    host_idle: np.ndarray      # (B, H)
+    host_max: np.ndarray       # (B, H)
+    host_mask: np.ndarray      # (B, H) bool
+
+    @property
+    def size(self) -> int:
+        return len(self.n_tasks)
+
+
+def pack_instances(instances: Sequence[Tuple[list, list, list]]) -> PackedInstances:
+    """
+    Stack a sequence of (tasks, vms, hosts) instances into padded arrays.
+    VMs are placed on hosts round-robin, exactly as evaluate_solution does.
+    """
+    if len(instances) == 0:
+        raise ValueError("No instances to pack")
+    B = len(instances)
+    n_tasks = np.array([len(t) for t, _, _ in instances], dtype=np.int64)
+    n_vms = np.array([len(v) for _, v, _ in instances], dtype=np.int64)
+    n_hosts = np.array([len(h) for _, _, h in instances], dtype=np.int64)
+    if (n_hosts == 0).any():
+        raise ValueError("Every instance needs at least one host")
+    T = max(1, int(n_tasks.max()))
+    V = max(1, int(n_vms.max()))
+    H = int(n_hosts.max())
+
+    task_cpu = np.zeros((B, T))
+    task_mem = np.zeros((B, T))
+    task_len = np.zeros((B, T))
+    vm_cpu_cap = np.zeros((B, V))
+    vm_mem_cap = np.zeros((B, V))
+    vm_base_len = np.zeros((B, V))
+    vm_base_cpu = np.zeros((B, V))
+    vm_base_sla = np.zeros(B)
+    vm_host = np.zeros((B, V, H))
+    host_cpu_cap = np.ones((B, H))
+    host_base_cpu = np.zeros((B, H))
+    host_idle = np.zeros((B, H))
+    host_max = np.zeros((B, H))
+
+    for b, (tasks, vms, hosts) in enumerate(instances):
+        nt, nv, nh = len(tasks), len(vms), len(hosts)
+        task_cpu[b, :nt] = [t.cpu for t in tasks]
+        task_mem[b, :nt] = [t.mem for t in tasks]
+        task_len[b, :nt] = [t.length for t in tasks]
+        vm_cpu_cap[b, :nv] = [vm.cpu_capacity for vm in vms]
+        vm_mem_cap[b, :nv] = [vm.mem_capacity for vm in vms]
+        vm_base_len[b, :nv] = [sum(t.length for t in vm.tasks) for vm in vms]
+        vm_base_cpu[b, :nv] = [vm.cpu_load for vm in vms]
+        vm_base_sla[b] = sum(
+            1 for vm in vms for t in getattr(vm, 'tasks', []) if getattr(t, 'length', 0) > SLA_LENGTH_LIMIT
+        )
+        vm_host[b, np.arange(nv), np.arange(nv) % nh] = 1.0
+        host_cpu_cap[b, :nh] = [h.cpu_capacity for h in hosts]
+        host_base_cpu[b, :nh] = [sum(vm.cpu_load for vm in h.vms) for h in hosts]
+        host_idle[b, :nh] = [h.idle_power for h in hosts]
+        host_max[b, :nh] = [h.max_power for h in hosts]
+
+    return PackedInstances(
+        n_tasks=n_tasks, n_vms=n_vms, n_hosts=n_hosts,
+        task_cpu=task_cpu, task_mem=task_mem, task_len=task_len,
+        task_mask=np.arange(T)[None, :] < n_tasks[:, None],
+        vm_cpu_cap=vm_cpu_cap, vm_mem_cap=vm_mem_cap,
+        vm_mask=np.arange(V)[None, :] < n_vms[:, None],
+        vm_base_len=vm_base_len, vm_base_cpu=vm_base_cpu, vm_base_sla=vm_base_sla,
+        vm_host=vm_host, host_cpu_cap=host_cpu_cap, host_base_cpu=host_base_cpu,
+        host_idle=host_idle, host_max=host_max,
+        host_mask=np.arange(H)[None, :] < n_hosts[:, None],
+    )
+
+
+def _vm_sums(pop: np.ndarray, valid: np.ndarray, values: np.ndarray, V: int) -> np.ndarray:
+    """Per-VM sums of a per-task quantity for every chromosome. pop: (B, P, T) -> (B, P, V)."""
+    B, P, T = pop.shape
+    slot = np.arange(B * P).reshape(B, P, 1) * V + pop
+    weights = np.broadcast_to(values[:, None, :], pop.shape)
+    sums = np.bincount(slot[valid], weights=weights[valid], minlength=B * P * V)
+    return sums.reshape(B, P, V)
+
+
+def evaluate_population_batch(pop: np.ndarray, packed: PackedInstances, weights=None):
+    """
+    Vectorized equivalent of evaluate_solution for a whole batch of populations.
+
+    Args:
+        pop: np.ndarray (B, P, T)
+            pop[b, p, i] is the VM index of task i in chromosome p of instance b
+            (-1 or out of range means unassigned, padded task slots are ignored).
+        packed: PackedInstances
+            Output of pack_instances.
+        weights: dict (optional)
+            Same meaning and default as in evaluate_solution.
+
+    Returns:
+        fitness: np.ndarray (B, P)
+            Fitness of every chromosome (lower is better).
+        metrics: dict
+            Each metric of evaluate_solution as an array of shape (B, P).
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+    V = packed.vm_cpu_cap.shape[1]
+    valid = (pop >= 0) & (pop < packed.n_vms[:, None, None]) & packed.task_mask[:, None, :]
+
+    vm_len = packed.vm_base_len[:, None, :] + _vm_sums(pop, valid, packed.task_len, V)
+    vm_cpu = packed.vm_base_cpu[:, None, :] + _vm_sums(pop, valid, packed.task_cpu, V)
+    makespan = np.maximum(vm_len.max(axis=2), 0.0)
+
+    host_cpu = np.einsum('bpv,bvh->bph', vm_cpu, packed.vm_host) + packed.host_base_cpu[:, None, :]
+    util = np.minimum(1.0, host_cpu / packed.host_cpu_cap[:, None, :])
+    power = packed.host_idle[:, None, :] + (packed.host_max - packed.host_idle)[:, None, :] * util
+    host_mask = packed.host_mask[:, None, :]
+    energy = np.where(host_mask, power, 0.0).sum(axis=2)
+    avg_util = np.where(host_mask, util, 0.0).sum(axis=2) / packed.n_hosts[:, None]
+
+    unassigned = (packed.task_mask[:, None, :] & ~valid).sum(axis=2)
+    long_tasks = (packed.task_len > SLA_LENGTH_LIMIT)[:, None, :]
+    sla_violations = (valid & long_tasks).sum(axis=2) + packed.vm_base_sla[:, None] + unassigned
+
+    fitness = (
+        weights["makespan"] * makespan +
+        weights["energy"] * energy -
+        weights["util"] * avg_util +
+        weights["sla"] * sla_violations
+    )
+    metrics = {
+        "makespan": makespan,
+        "energy": energy,
+        "avg_utilization": avg_util,
+        "sla_violations": sla_violations,
+        "unassigned_tasks": unassigned,
+    }
+    return fitness, metrics
+
+
+def _metrics_dict(fitness: float, values: dict) -> dict:
+    """Build the same metrics dict as evaluate_solution from per-metric scalars."""
+    info = {"fitness": float(fitness)}
+    for key in METRIC_KEYS:
+        info[key] = int(values[key]) if key in ("sla_violations", "unassigned_tasks") else float(values[key])
+    return info
+
+
+def evaluate_solutions_batch(chroms: Sequence[List[int]], instances, weights=None):
+    """
+    Evaluate one chromosome per instance in a single vectorized pass.
+    Returns a list of (fitness, metrics) tuples, one per instance, like evaluate_solution.
+    """
+    packed = pack_instances(instances)
+    pop = np.full((packed.size, 1, packed.task_mask.shape[1]), -1, dtype=np.int64)
+    for b, chrom in enumerate(chroms):
+        pop[b, 0, :len(chrom)] = chrom
+    fitness, metrics = evaluate_population_batch(pop, packed, weights)
+    return [
+        (float(fitness[b, 0]), _metrics_dict(fitness[b, 0], {key: metrics[key][b, 0] for key in METRIC_KEYS}))
+        for b in range(packed.size)
+    ]
+
+
+# -------------------------
+# Batched GA operators
+# -------------------------
+def init_population_batch(packed: PackedInstances, pop_size: int, rng: np.random.Generator) -> np.ndarray:
+    B, T = packed.task_mask.shape
+    genes = (rng.random((B, pop_size, T)) * packed.n_vms[:, None, None]).astype(np.int64)
+    return np.where(packed.task_mask[:, None, :], genes, -1)
+
+
+def tournament_select_batch(fitness: np.ndarray, n: int, rng: np.random.Generator, k: int = 3) -> np.ndarray:
+    """Pick n parents per instance, each the best of k distinct random individuals. Returns (B, n) indices."""
+    B, P = fitness.shape
+    k = min(k, P)
+    contenders = rng.integers(0, P, size=(B, n, k))
+    # like random.sample, contenders must be distinct: redraw the (few) slots with repeats
+    while True:
+        ordered = np.sort(contenders, axis=2)
+        repeats = (ordered[:, :, 1:] == ordered[:, :, :-1]).any(axis=2)
+        if not repeats.any():
+            break
+        contenders[repeats] = rng.integers(0, P, size=(int(repeats.sum()), k))
+    contender_f = np.take_along_axis(fitness[:, None, :], contenders, axis=2)
+    return np.take_along_axis(contenders, contender_f.argmin(axis=2)[:, :, None], axis=2)[:, :, 0]
+
+
+def single_point_crossover_batch(a: np.ndarray, b: np.ndarray, n_tasks: np.ndarray, pc: float,
+                                 rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Cross each pair (a[b, i], b[b, i]) with probability pc at a point in [1, n_tasks-1]."""
+    B, n, T = a.shape
+    high = np.maximum(n_tasks, 2)[:, None]
+    pt = rng.integers(1, high, size=(B, n))
+    # instances with a single task cannot be cut; put the point past the end (no-op)
+    pt = np.where(n_tasks[:, None] < 2, T, pt)
+    swap = (np.arange(T)[None, None, :] >= pt[:, :, None]) & (rng.random((B, n)) < pc)[:, :, None]
+    return np.where(swap, b, a), np.where(swap, a, b)
+
+
+def mutate_batch(pop: np.ndarray, packed: PackedInstances, pm: float, rng: np.random.Generator) -> np.ndarray:
+    hit = (rng.random(pop.shape) < pm) & packed.task_mask[:, None, :]
+    genes = (rng.random(pop.shape) * packed.n_vms[:, None, None]).astype(np.int64)
+    return np.where(hit, genes, pop)
+
+
+def repair_batch(pop: np.ndarray, packed: PackedInstances) -> np.ndarray:
+    """
+    Vectorized version of ga_core.repair applied to every chromosome of every instance.
+    Performs the same greedy passes (one move per overloaded VM per pass, largest-CPU
+    movable task first, first VM that fits as target) so results match the scalar repair.
+    """
+    B, P, T = pop.shape
+    V = packed.vm_cpu_cap.shape[1]
+    chroms = pop.reshape(B * P, T).copy()
+    inst = np.repeat(np.arange(B), P)
+    valid = (chroms >= 0) & (chroms < packed.n_vms[inst][:, None])
+    slot = np.arange(B * P)[:, None] * V + chroms
+    load_cpu = np.bincount(slot[valid], weights=packed.task_cpu[inst][valid], minlength=B * P * V).reshape(B * P, V)
+    load_mem = np.bincount(slot[valid], weights=packed.task_mem[inst][valid], minlength=B * P * V).reshape(B * P, V)
+    cap_cpu = packed.vm_cpu_cap[inst]
+    cap_mem = packed.vm_mem_cap[inst]
+    vm_ok = packed.vm_mask[inst]
+
+    changed = np.ones(B * P, dtype=bool)
+    while changed.any():
+        active = changed
+        changed = np.zeros(B * P, dtype=bool)
+        for vm_i in range(V):
+            rows = np.nonzero(active & vm_ok[:, vm_i] &
+                              ((load_cpu[:, vm_i] > cap_cpu[:, vm_i]) | (load_mem[:, vm_i] > cap_mem[:, vm_i])))[0]
+            if len(rows) == 0:
+                continue
+            t_cpu = packed.task_cpu[inst[rows]]
+            t_mem = packed.task_mem[inst[rows]]
+            target_ok = vm_ok[rows].copy()
+            target_ok[:, vm_i] = False
+            fits = ((load_cpu[rows][:, None, :] + t_cpu[:, :, None] <= cap_cpu[rows][:, None, :]) &
+                    (load_mem[rows][:, None, :] + t_mem[:, :, None] <= cap_mem[rows][:, None, :]) &
+                    target_ok[:, None, :])
+            movable = (chroms[rows] == vm_i) & fits.any(axis=2)
+            has_move = movable.any(axis=1)
+            rows, movable, fits = rows[has_move], movable[has_move], fits[has_move]
+            if len(rows) == 0:
+                continue
+            # largest CPU first; argmax keeps the lowest index on ties like the stable sort in repair
+            t_idx = np.where(movable, t_cpu[has_move], -np.inf).argmax(axis=1)
+            target = fits[np.arange(len(rows)), t_idx].argmax(axis=1)
+            cpu = t_cpu[has_move][np.arange(len(rows)), t_idx]
+            mem = t_mem[has_move][np.arange(len(rows)), t_idx]
+            chroms[rows, t_idx] = target
+            load_cpu[rows, vm_i] -= cpu
+            load_mem[rows, vm_i] -= mem
+            load_cpu[rows, target] += cpu
+            load_mem[rows, target] += mem
+            changed[rows] = True
+    return chroms.reshape(B, P, T)
+
+
+# -------------------------
+# Main batched GA runner
+# -------------------------
+def run_ga_batch(instances: Sequence[Tuple[list, list, list]], pop_size: int = 50, gen: int = 100,
+                 pc: float = 0.8, pm: float = 0.05, seed: Optional[int] = None,
+                 elitism_frac: float = 0.05, weights=None, verbose: bool = False):
+    """
+    Run the generational GA of run_ga on many independent instances at once.
+    Each instance keeps its own population; populations never mix.
+    Returns: list of (best_chromosome, best_fitness, best_info_dict), one per instance.
+    """
+    packed = pack_instances(instances)
+    if (packed.n_vms == 0).any():
+        raise ValueError("Every instance needs at least one VM")
+    rng = np.random.default_rng(seed)
+    B = packed.size
+    rows = np.arange(B)
+
+    pop = init_population_batch(packed, pop_size, rng)
+    best = np.full((B, pop.shape[2]), -1, dtype=np.int64)
+    best_f = np.full(B, np.inf)
+    best_metrics = {key: np.zeros(B) for key in METRIC_KEYS}
+
+    elite_count = min(pop_size, max(1, int(elitism_frac * pop_size)))
+    n_children = pop_size - elite_count
+    n_pairs = (n_children + 1) // 2
+
+    for g in range(gen):
+        # Evaluate every population of the batch in one pass
+        fitness, metrics = evaluate_population_batch(pop, packed, weights)
+        gen_best_idx = fitness.argmin(axis=1)
+        gen_best_f = fitness[rows, gen_best_idx]
+        improved = gen_best_f < best_f
+        best_f = np.where(improved, gen_best_f, best_f)
+        best[improved] = pop[rows, gen_best_idx][improved]
+        for key in METRIC_KEYS:
+            best_metrics[key][improved] = metrics[key][rows, gen_best_idx][improved]
+
+        # Elitism
+        order = np.argsort(fitness, axis=1, kind='stable')
+        elites = np.take_along_axis(pop, order[:, :elite_count, None], axis=1)
+
+        # Offspring: selection, crossover, mutation, repair for the whole batch
+        if n_pairs > 0:
+            parents = tournament_select_batch(fitness, 2 * n_pairs, rng)
+            parents = np.take_along_axis(pop, parents[:, :, None], axis=1)
+            c1, c2 = single_point_crossover_batch(parents[:, :n_pairs], parents[:, n_pairs:], packed.n_tasks, pc, rng)
+            children = np.concatenate([c1, c2], axis=1)[:, :n_children]
+            children = mutate_batch(children, packed, pm, rng)
+            children = repair_batch(children, packed)
+            pop = np.concatenate([elites, children], axis=1)
+        else:
+            pop = elites
+
+        if verbose:
+            print(f"Generation {g+1}/{gen} - mean gen_best_fitness = {gen_best_f.mean():.6f}  "
+                  f"mean global_best = {best_f.mean():.6f}")
+
+    results = []
+    for b in range(B):
+        if not np.isfinite(best_f[b]):
+            results.append((None, float('inf'), None))
+            continue
+        info = _metrics_dict(best_f[b], {key: best_metrics[key][b] for key in METRIC_KEYS})
+        results.append((best[b, :packed.n_tasks[b]].tolist(), float(best_f[b]), info))
+    return results
@@ -1,6 +1,11 @@
 from src.sim.cluster import Cluster
 from copy import deepcopy
 
+# Default importance of each metric in the fitness (shared with src/ga/batch.py)
+DEFAULT_WEIGHTS = {"makespan": 0.4, "energy": 0.3, "util": 0.2, "sla": 0.1}
+# Tasks longer than this count as SLA violations
+SLA_LENGTH_LIMIT = 1000
+
 def evaluate_solution(chrom, tasks, vms, hosts, weights=None):
     """
     Evaluates a solution (chromosome) for the cloud resource allocation problem.
@@ -28,7 +33,7 @@ def evaluate_solution(chrom, tasks, vms, hosts, weights=None):
 
     # Default weights if not provided
     if weights is None:
-        weights = {"makespan": 0.4, "energy": 0.3, "util": 0.2, "sla": 0.1}
+        weights = DEFAULT_WEIGHTS
 
     # Create deep copies of VMs and Hosts to avoid modifying originals
     vms_copy = deepcopy(vms)
@@ -58,7 +63,7 @@ def evaluate_solution(chrom, tasks, vms, hosts, weights=None):
 
     # SLA violations: Example criterion - tasks longer than 1000 units
     sla_violations = sum(
-        1 for vm in vms_copy for t in getattr(vm, 'tasks', []) if getattr(t, 'length', 0) > 1000
+        1 for vm in vms_copy for t in getattr(vm, 'tasks', []) if getattr(t, 'length', 0) > SLA_LENGTH_LIMIT
     )
     # Optionally, count unassigned tasks as SLA violations
     sla_violations += unassigned_tasks
@@ -4,6 +4,8 @@ import os
 import csv
 import json
 
+import numpy as np
+
 
 def ensure_dir(path):
     """Create directory if it does not exist."""
@@ -34,6 +36,79 @@ def load_tasks_from_csv(path, TaskClass):
     return tasks
 
 
+def _read_rows(path, file_format=None):
+    """
+    Yield rows of a CSV file or a .npy file of structured records as dicts.
+    file_format ("csv" or "npy") defaults to "npy" for .npy files and "csv" otherwise,
+    the same rule data/synthetic_generator uses when writing.
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File not found: {path}")
+    if file_format is None:
+        file_format = "npy" if path.endswith(".npy") else "csv"
+    if file_format not in ("csv", "npy"):
+        raise ValueError(f"Unknown file format: {file_format} (expected 'csv' or 'npy')")
+
+    if file_format == "npy":
+        records = np.load(path, mmap_mode="r")
+        names = records.dtype.names
+        # one tolist() per column instead of numpy scalar access per row
+        columns = [records[name].tolist() for name in names]
+        for values in zip(*columns):
+            yield dict(zip(names, values))
+    else:
+        with open(path, newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+
+
+def load_tasks(path, TaskClass, file_format=None):
+    """
+    Load tasks from a CSV or .npy file (e.g. written by
+    data/synthetic_generator.generate_workload). Missing columns get the
+    same defaults as load_tasks_from_csv.
+    """
+    return [
+        TaskClass(
+            id=i,
+            cpu=float(row.get("cpu", 100)),
+            mem=float(row.get("mem", 128)),
+            length=float(row.get("length", 1000)),
+            arrival=float(row.get("arrival", 0)),
+        )
+        for i, row in enumerate(_read_rows(path, file_format))
+    ]
+
+
+def load_vms(path, VMClass, file_format=None):
+    """
+    Load VMs from a CSV or .npy file written by data/synthetic_generator.generate_fleet.
+    """
+    return [
+        VMClass(
+            id=int(row["id"]),
+            cpu_capacity=float(row["cpu_capacity"]),
+            mem_capacity=float(row["mem_capacity"]),
+        )
+        for row in _read_rows(path, file_format)
+    ]
+
+
+def load_hosts(path, HostClass, file_format=None):
+    """
+    Load hosts from a CSV or .npy file written by data/synthetic_generator.generate_fleet.
+    """
+    return [
+        HostClass(
+            id=int(row["id"]),
+            cpu_capacity=float(row["cpu_capacity"]),
+            mem_capacity=float(row["mem_capacity"]),
+            idle_power=float(row["idle_power"]),
+            max_power=float(row["max_power"]),
+        )
+        for row in _read_rows(path, file_format)
+    ]
+
+
 def save_json(path, data):
     ensure_dir(os.path.dirname(path))
     with open(path, "w", encoding="utf-8") as f:
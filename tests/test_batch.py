@@ -0,0 +1,76 @@
+# tests/test_batch.py
+
+# Check that the batched GA agrees with the per-instance code path
+
+import random
+import numpy as np
+import pytest
+from src.sim.entities import Task, VM, Host
+from src.ga.ga_core import repair
+from src.ga.fitness import evaluate_solution
+from src.ga.batch import (
+    pack_instances, evaluate_solutions_batch, repair_batch, run_ga_batch
+)
+
+
+def make_instance(rng, num_tasks, num_vms, num_hosts):
+    tasks = [
+        Task(id=i, cpu=rng.choice([100, 150, 200, 400]), mem=rng.choice([128, 256, 512]),
+             length=rng.randint(500, 1500), arrival=i)
+        for i in range(num_tasks)
+    ]
+    vms = [VM(id=i, cpu_capacity=500, mem_capacity=1024) for i in range(num_vms)]
+    hosts = [Host(id=i, cpu_capacity=2000, mem_capacity=8192) for i in range(num_hosts)]
+    return tasks, vms, hosts
+
+
+def make_batch(seed=0):
+    rng = random.Random(seed)
+    shapes = [(3, 2, 1), (8, 3, 2), (1, 1, 1), (12, 5, 3), (6, 4, 1)]
+    return [make_instance(rng, *shape) for shape in shapes], rng
+
+
+def test_evaluate_batch_matches_evaluate_solution():
+    instances, rng = make_batch()
+    chroms = [[rng.randrange(-1, len(vms)) for _ in tasks] for tasks, vms, _ in instances]
+
+    results = evaluate_solutions_batch(chroms, instances)
+
+    for chrom, (tasks, vms, hosts), (f_batch, info_batch) in zip(chroms, instances, results):
+        f_ref, info_ref = evaluate_solution(chrom, tasks, vms, hosts)
+        assert f_batch == pytest.approx(f_ref)
+        for key, value in info_ref.items():
+            assert info_batch[key] == pytest.approx(value)
+
+
+def test_repair_batch_matches_repair():
+    instances, rng = make_batch(seed=1)
+    packed = pack_instances(instances)
+    pop = np.full((packed.size, 4, packed.task_mask.shape[1]), -1, dtype=np.int64)
+    for b, (tasks, vms, _) in enumerate(instances):
+        for p in range(4):
+            pop[b, p, :len(tasks)] = [rng.randrange(len(vms)) for _ in tasks]
+
+    repaired = repair_batch(pop, packed)
+
+    for b, (tasks, vms, _) in enumerate(instances):
+        for p in range(4):
+            expected = repair(pop[b, p, :len(tasks)].tolist(), tasks, vms)
+            assert repaired[b, p, :len(tasks)].tolist() == expected
+
+
+def test_run_ga_batch():
+    instances, _ = make_batch(seed=2)
+
+    results = run_ga_batch(instances, pop_size=10, gen=5, seed=42)
+
+    assert len(results) == len(instances)
+    for (tasks, vms, hosts), (best, best_f, best_info) in zip(instances, results):
+        assert len(best) == len(tasks)
+        assert all(0 <= g < len(vms) for g in best)
+        f_ref, _ = evaluate_solution(best, tasks, vms, hosts)
+        assert best_f == pytest.approx(f_ref)
+        assert "energy" in best_info
+
+    # same seed -> same result
+    assert run_ga_batch(instances, pop_size=10, gen=5, seed=42) == results
@@ -0,0 +1,128 @@
+# tests/test_synthetic_generator.py
+
+# Check the vectorized workload / fleet generator
+
+import numpy as np
+import pytest
+from data.synthetic_generator import generate_workload, generate_fleet, _format_csv_rows
+from src.sim.entities import Task, VM, Host
+from src.utils.io_utils import load_tasks_from_csv, load_tasks, load_vms, load_hosts
+
+
+@pytest.mark.parametrize("arrival", ["poisson", "bursty", "diurnal"])
+def test_workload_reproducible_and_chunk_independent(tmp_path, arrival):
+    a = tmp_path / "a.npy"
+    b = tmp_path / "b.npy"
+    generate_workload(str(a), num_tasks=5000, seed=7, arrival=arrival, chunk_size=5000,
+                      diurnal_period=3600.0)
+    generate_workload(str(b), num_tasks=5000, seed=7, arrival=arrival, chunk_size=333,
+                      diurnal_period=3600.0)
+
+    ra, rb = np.load(a), np.load(b)
+    assert len(ra) == 5000
+    for name in ra.dtype.names:
+        np.testing.assert_allclose(ra[name], rb[name])
+    assert (np.diff(ra["arrival"]) >= 0).all()
+    # long-run arrival rate stays close to 1 / mean_interarrival
+    assert ra["arrival"][-1] / 5000 == pytest.approx(10.0, rel=0.3)
+
+
+def test_burst_params_ignored_for_other_patterns(tmp_path):
+    generate_workload(str(tmp_path / "w.npy"), num_tasks=10, arrival="poisson", burst_size=0)
+    with pytest.raises(ValueError):
+        generate_workload(str(tmp_path / "w.npy"), num_tasks=10, arrival="bursty", burst_size=0)
+
+
+@pytest.mark.parametrize("params", [
+    dict(arrival="diurnal", diurnal_period=0),
+    dict(arrival="diurnal", diurnal_period=-3600.0),
+    dict(arrival="poisson", mean_interarrival=0),
+    dict(arrival="bursty", mean_interarrival=-1.0),
+])
+def test_invalid_arrival_params(tmp_path, params):
+    with pytest.raises(ValueError):
+        generate_workload(str(tmp_path / "w.npy"), num_tasks=10, **params)
+
+
+def test_workload_csv_matches_npy(tmp_path):
+    csv_path = tmp_path / "w.csv"
+    npy_path = tmp_path / "w.npy"
+    spec = dict(num_tasks=1000, seed=3, cpu=("uniform", 100, 200), length=("lognormal", 5, 1), chunk_size=128)
+    generate_workload(str(csv_path), **spec)
+    generate_workload(str(npy_path), **spec)
+
+    from_csv = load_tasks_from_csv(str(csv_path), Task)
+    from_npy = load_tasks(str(npy_path), Task)
+    assert len(from_csv) == len(from_npy) == 1000
+    for x, y in zip(from_csv, from_npy):
+        assert x.arrival == pytest.approx(y.arrival, abs=0.01)
+        assert x.mem == y.mem
+        assert x.cpu == pytest.approx(y.cpu, rel=1e-6)
+        assert 100 <= x.cpu <= 200
+
+
+def test_csv_formatting_matches_python():
+    rng = np.random.default_rng(0)
+    chunk = {
+        'id': np.arange(1, 1001),
+        'arrival': rng.exponential(1000.0, 1000),
+        'cpu': np.array([round(v, d) for v, d in zip(rng.uniform(-1000, 1000, 1000), rng.integers(0, 7, 1000))]),
+        'mem': rng.choice([0.0, 512.0, 4096.0], 1000),
+    }
+    columns = ['id', 'arrival', 'cpu', 'mem']
+
+    def python_format(row):
+        i, arrival, cpu, mem = row
+        cells = [f"{i:d}", f"{arrival:.2f}"]
+        for value in (cpu, mem):
+            text = f"{value:.6f}".rstrip("0").rstrip(".")
+            cells.append("0" if text == "-0" else text)
+        return ",".join(cells) + "\n"
+
+    expected = "".join(python_format(row) for row in zip(*(chunk[c].tolist() for c in columns)))
+    assert _format_csv_rows(chunk, columns).decode("ascii") == expected
+
+
+def test_fleet(tmp_path):
+    vm_path, host_path = tmp_path / "vms.csv", tmp_path / "hosts.csv"
+    generate_fleet(str(vm_path), str(host_path), num_vms=25, num_hosts=4, seed=1)
+
+    vms = load_vms(str(vm_path), VM)
+    hosts = load_hosts(str(host_path), Host)
+    assert [vm.id for vm in vms] == list(range(25))
+    assert all(vm.cpu_capacity in (1000, 2000, 4000) for vm in vms)
+    assert len(hosts) == 4 and hosts[0].max_power == 250.0
+
+
+def test_unseeded(tmp_path):
+    generate_workload(str(tmp_path / "w.npy"), num_tasks=100, seed=None)
+    generate_fleet(str(tmp_path / "v1.npy"), str(tmp_path / "h1.npy"), num_vms=100, seed=None,
+                   vm_cpu=("uniform", 0, 1))
+    generate_fleet(str(tmp_path / "v2.npy"), str(tmp_path / "h2.npy"), num_vms=100, seed=None,
+                   vm_cpu=("uniform", 0, 1))
+
+    assert len(np.load(tmp_path / "w.npy")) == 100
+    assert not np.array_equal(np.load(tmp_path / "v1.npy")["cpu_capacity"],
+                              np.load(tmp_path / "v2.npy")["cpu_capacity"])
+
+
+def test_npy_without_suffix(tmp_path):
+    path = tmp_path / "workload.bin"
+    generate_workload(str(path), num_tasks=50, file_format="npy")
+
+    tasks = load_tasks(str(path), Task, file_format="npy")
+    assert len(tasks) == 50 and tasks[0].cpu in (500, 750, 1000, 1200, 1500)
+
+
+def test_fleet_independent_of_workload(tmp_path):
+    uniform = ("uniform", 0, 1)
+    generate_workload(str(tmp_path / "w.npy"), num_tasks=1000, seed=1, cpu=uniform, mem=uniform)
+    generate_fleet(str(tmp_path / "v.npy"), str(tmp_path / "h.npy"), num_vms=1000, num_hosts=1000, seed=1,
+                   vm_cpu=uniform, vm_mem=uniform, host_cpu=uniform, host_mem=uniform)
+    tasks, vms, hosts = (np.load(tmp_path / f) for f in ("w.npy", "v.npy", "h.npy"))
+
+    columns = [tasks["cpu"], tasks["mem"], np.diff(tasks["arrival"], prepend=0.0),
+               vms["cpu_capacity"], vms["mem_capacity"], hosts["cpu_capacity"], hosts["mem_capacity"]]
+    corr = np.corrcoef(np.array(columns, dtype=np.float64))
+    off_diagonal = corr[~np.eye(len(columns), dtype=bool)]
+    assert np.abs(off_diagonal).max() < 0.15